@@ -13,6 +13,7 @@ A Python tool for generating sample sales data, analyzing it, and creating profe
 ## Requirements
 - pandas
 - numpy
+- numexpr
 - matplotlib
 - xlsxwriter
 - openpyxl
@@ -25,11 +26,11 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
-import random
 import logging
 import argparse
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Set up logging
 logging.basicConfig(
@@ -41,6 +42,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger('excel_sales_analyzer')
 
+# Row count above which SalesAnalyzer runs its aggregations in parallel
+PARALLEL_ANALYSIS_THRESHOLD = 100_000
+
 
 class SalesDataGenerator:
     """Class to generate sample sales data for demonstration"""
@@ -59,6 +63,10 @@ class SalesDataGenerator:
             "Headphones": (30, 300),
             "Printer": (100, 400)
         }
+        
+        # Price bounds aligned with self.products, indexed by product code
+        self._price_low = np.array([self.price_ranges[p][0] for p in self.products], dtype=np.float64)
+        self._price_high = np.array([self.price_ranges[p][1] for p in self.products], dtype=np.float64)
     
     def generate_data(self, num_records=100, days_back=90):
         """
@@ -73,37 +81,55 @@ class SalesDataGenerator:
         """
         logger.info(f"Generating {num_records} sample sales records")
         
-        # Create date range
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days_back)
-        dates = [start_date + timedelta(days=x) for x in range((end_date - start_date).days)]
-        
-        # Generate random data
-        sales_data = []
-        for _ in range(num_records):
-            product = random.choice(self.products)
-            unit_price = round(random.uniform(*self.price_ranges[product]), 2)
-            quantity = random.randint(1, 10)
-            date = random.choice(dates)
-            region = random.choice(self.regions)
-            channel = random.choice(self.sales_channels)
-            
-            sales_data.append({
-                "Date": date.strftime("%Y-%m-%d"),
-                "Product": product,
-                "Region": region,
-                "Channel": channel,
-                "Units": quantity,
-                "Unit_Price": unit_price,
-                "Total_Sale": round(quantity * unit_price, 2)
-            })
+        rng = np.random.default_rng()
+        
+        # Sample day offsets into the date range instead of materializing it
+        start_date = datetime.now() - timedelta(days=days_back)
+        day_offsets = rng.integers(0, days_back, num_records).astype('timedelta64[D]')
+        dates = np.datetime64(start_date.date(), 'D') + day_offsets
+        
+        # Generate random data column by column
+        product_idx = rng.integers(0, len(self.products), num_records)
+        region_idx = rng.integers(0, len(self.regions), num_records)
+        channel_idx = rng.integers(0, len(self.sales_channels), num_records)
+        units = rng.integers(1, 11, num_records, dtype=np.int32)
+        
+        unit_price = rng.uniform(self._price_low[product_idx], self._price_high[product_idx])
+        np.round(unit_price, 2, out=unit_price)
+        
+        sales_df = pd.DataFrame({
+            "Date": dates.astype('datetime64[ns]'),
+            "Product": pd.Categorical.from_codes(product_idx, categories=self.products),
+            "Region": pd.Categorical.from_codes(region_idx, categories=self.regions),
+            "Channel": pd.Categorical.from_codes(channel_idx, categories=self.sales_channels),
+            "Units": units,
+            "Unit_Price": unit_price
+        }, copy=False)
         
-        return pd.DataFrame(sales_data)
+        # eval dispatches to numexpr (multi-threaded) when it is installed
+        sales_df['Total_Sale'] = sales_df.eval('Units * Unit_Price').round(2)
+        
+        return sales_df
 
 
 class ExcelWriter:
     """Class to write and format Excel files"""
     
+    ENGINES = ('xlsxwriter', 'pyexcelerate', 'polars')
+    
+    def __init__(self, engine='xlsxwriter'):
+        """
+        Initialize the writer
+        
+        Args:
+            engine (str): 'xlsxwriter' for the formatted sheet, 'pyexcelerate'
+                for a faster, values-only sheet, or 'polars' for a formatted
+                sheet written through polars' write_excel
+        """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unsupported engine '{engine}', expected one of {self.ENGINES}")
+        self.engine = engine
+    
     def write_sales_data(self, df, filename="sales_data.xlsx", output_dir="output"):
         """
         Write the sales DataFrame to an Excel file with proper formatting
@@ -120,41 +146,15 @@ class ExcelWriter:
         os.makedirs(output_dir, exist_ok=True)
         filepath = os.path.join(output_dir, filename)
         
-        logger.info(f"Writing data to {filepath}")
+        logger.info(f"Writing data to {filepath} using {self.engine}")
         
         try:
-            # Create Excel writer
-            with pd.ExcelWriter(filepath, engine='xlsxwriter') as writer:
-                # Write data to sheet
-                df.to_excel(writer, sheet_name='Sales_Data', index=False)
-                
-                # Get the workbook and worksheet objects
-                workbook = writer.book
-                worksheet = writer.sheets['Sales_Data']
-                
-                # Add formats
-                header_format = workbook.add_format({
-                    'bold': True,
-                    'bg_color': '#D7E4BC',
-                    'border': 1
-                })
-                
-                money_format = workbook.add_format({'num_format': '$#,##0.00', 'border': 1})
-                date_format = workbook.add_format({'num_format': 'yyyy-mm-dd', 'border': 1})
-                border_format = workbook.add_format({'border': 1})
-                
-                # Apply formats
-                for col_num, value in enumerate(df.columns.values):
-                    worksheet.write(0, col_num, value, header_format)
-                
-                # Format the columns
-                worksheet.set_column('A:A', 12, date_format)  # Date column
-                worksheet.set_column('B:D', 15, border_format)  # Product, Region, Channel
-                worksheet.set_column('E:E', 8, border_format)  # Units
-                worksheet.set_column('F:G', 12, money_format)  # Price and Total columns
-                
-                # Add auto-filter
-                worksheet.autofilter(0, 0, len(df), len(df.columns) - 1)
+            if self.engine == 'pyexcelerate':
+                self._write_values_only(df, filepath)
+            elif self.engine == 'polars':
+                self._write_with_polars(df, filepath)
+            else:
+                self._write_formatted(df, filepath)
             
             logger.info(f"Data successfully written to {filepath}")
             return filepath
@@ -162,6 +162,82 @@ class ExcelWriter:
         except Exception as e:
             logger.error(f"Error writing Excel file: {str(e)}")
             raise
+    
+    @staticmethod
+    def _blank_missing(df):
+        """
+        Replace missing values (NaN/NaT) with None so they are written as blank cells
+        
+        The object-dtype copy this needs is only made when something is missing.
+        """
+        if not df.isna().any().any():
+            return df
+        return df.astype(object).where(df.notna(), None)
+    
+    def _write_formatted(self, df, filepath):
+        """Write the data sheet with xlsxwriter, including header, column formats and auto-filter"""
+        # Create Excel writer. In constant_memory mode each row is flushed
+        # to disk once the next one is started, so rows must be written in order.
+        with pd.ExcelWriter(filepath, engine='xlsxwriter',
+                            engine_kwargs={'options': {'constant_memory': True}}) as writer:
+            # Get the workbook and worksheet objects
+            workbook = writer.book
+            worksheet = workbook.add_worksheet('Sales_Data')
+            
+            # Add formats
+            header_format = workbook.add_format({
+                'bold': True,
+                'bg_color': '#D7E4BC',
+                'border': 1
+            })
+            
+            money_format = workbook.add_format({'num_format': '$#,##0.00', 'border': 1})
+            date_format = workbook.add_format({'num_format': 'yyyy-mm-dd', 'border': 1})
+            border_format = workbook.add_format({'border': 1})
+            
+            # Format the columns
+            worksheet.set_column('A:A', 12, date_format)  # Date column
+            worksheet.set_column('B:D', 15, border_format)  # Product, Region, Channel
+            worksheet.set_column('E:E', 8, border_format)  # Units
+            worksheet.set_column('F:G', 12, money_format)  # Price and Total columns
+            
+            # Add auto-filter
+            worksheet.autofilter(0, 0, len(df), len(df.columns) - 1)
+            
+            # Write header and data rows top to bottom
+            worksheet.write_row(0, 0, df.columns, header_format)
+            for row_num, row in enumerate(self._blank_missing(df).itertuples(index=False), start=1):
+                worksheet.write_row(row_num, 0, row)
+    
+    def _write_values_only(self, df, filepath):
+        """Write the data sheet with pyexcelerate, without cell styling"""
+        from pyexcelerate import Workbook, Style, Format
+        
+        workbook = Workbook()
+        worksheet = workbook.new_sheet('Sales_Data',
+                                       data=[df.columns.tolist()] + self._blank_missing(df).values.tolist())
+        
+        # Dates are stored as serial numbers, so the date column still needs its number format
+        worksheet.set_col_style(df.columns.get_loc('Date') + 1, Style(format=Format('yyyy-mm-dd')))
+        workbook.save(filepath)
+    
+    def _write_with_polars(self, df, filepath):
+        """Write the data sheet with polars, keeping the number formats and auto-filter"""
+        import polars as pl
+        
+        pl.from_pandas(df).write_excel(
+            filepath,
+            worksheet='Sales_Data',
+            column_formats={
+                'Date': 'yyyy-mm-dd',
+                'Unit_Price': '$#,##0.00',
+                'Total_Sale': '$#,##0.00'
+            },
+            header_format={'bold': True, 'bg_color': '#D7E4BC', 'border': 1},
+            column_widths={'Date': 90, 'Product': 110, 'Region': 110, 'Channel': 110,
+                           'Units': 60, 'Unit_Price': 90, 'Total_Sale': 90},
+            autofilter=True
+        )
 
 
 class SalesAnalyzer:
@@ -188,7 +264,11 @@ class SalesAnalyzer:
         """
         try:
             logger.info(f"Loading data from {filename}")
-            self.df = pd.read_excel(filename)
+            self.df = pd.read_excel(filename, parse_dates=['Date'])
+            
+            # Low-cardinality text columns group much faster as categoricals
+            category_cols = ['Product', 'Region', 'Channel']
+            self.df[category_cols] = self.df[category_cols].astype('category')
             return self
         except Exception as e:
             logger.error(f"Error loading Excel file: {str(e)}")
@@ -207,32 +287,49 @@ class SalesAnalyzer:
         
         logger.info("Performing sales data analysis")
         
-        # Ensure date column is datetime
-        self.df['Date'] = pd.to_datetime(self.df['Date'])
-        
         # Basic statistics and analysis
         total_sales = self.df['Total_Sale'].sum()
         avg_sale_per_transaction = self.df['Total_Sale'].mean()
         max_sale = self.df['Total_Sale'].max()
         
-        # Sales by product
-        product_sales = self.df.groupby('Product')['Total_Sale'].sum().sort_values(ascending=False)
-        
-        # Sales by region
-        region_sales = self.df.groupby('Region')['Total_Sale'].sum().sort_values(ascending=False)
-        
-        # Sales by channel
-        channel_sales = self.df.groupby('Channel')['Total_Sale'].sum().sort_values(ascending=False)
-        
-        # Sales trend over time
-        self.df['Week'] = self.df['Date'].dt.isocalendar().week
-        weekly_sales = self.df.groupby('Week')['Total_Sale'].sum()
-        
-        # Units sold by product
-        units_by_product = self.df.groupby('Product')['Units'].sum().sort_values(ascending=False)
+        # Bucket sales into weeks counted from the first sale. Nullable Int32 gives
+        # rows with a missing date <NA>, which the weekly groupby then drops.
+        start = self.df['Date'].min()
+        self.df['Week'] = ((self.df['Date'] - start).dt.days // 7 + 1).astype('Int32')
+        
+        # The group-by aggregations are independent of each other; on large
+        # frames run them concurrently (pandas releases the GIL in its C loops)
+        aggregations = {
+            # Sales and units by product (single pass)
+            'product': lambda: self.df.groupby('Product', sort=False, observed=True).agg(
+                Total_Sale=('Total_Sale', 'sum'),
+                Units=('Units', 'sum')
+            ),
+            # Total and average sale by region (single pass)
+            'region': lambda: self.df.groupby('Region', sort=False, observed=True).agg(
+                Total_Sale=('Total_Sale', 'sum'),
+                Avg_Sale=('Total_Sale', 'mean')
+            ),
+            # Sales by channel
+            'channel': lambda: self.df.groupby('Channel', sort=False, observed=True)['Total_Sale'].sum(),
+            # Sales trend over time
+            'weekly': lambda: self.df.groupby('Week')['Total_Sale'].sum()
+        }
         
-        # Average sale by region
-        avg_sale_by_region = self.df.groupby('Region')['Total_Sale'].mean().sort_values(ascending=False)
+        if len(self.df) > PARALLEL_ANALYSIS_THRESHOLD:
+            logger.debug(f"Running {len(aggregations)} aggregations in parallel")
+            with ThreadPoolExecutor(max_workers=len(aggregations)) as executor:
+                futures = {name: executor.submit(func) for name, func in aggregations.items()}
+                results = {name: future.result() for name, future in futures.items()}
+        else:
+            results = {name: func() for name, func in aggregations.items()}
+        
+        product_sales = results['product']['Total_Sale'].sort_values(ascending=False)
+        units_by_product = results['product']['Units'].sort_values(ascending=False)
+        region_sales = results['region']['Total_Sale'].sort_values(ascending=False)
+        avg_sale_by_region = results['region']['Avg_Sale'].sort_values(ascending=False)
+        channel_sales = results['channel'].sort_values(ascending=False)
+        weekly_sales = results['weekly']
         
         # Return all analyses
         return {
@@ -244,14 +341,19 @@ class SalesAnalyzer:
             "channel_sales": channel_sales,
             "weekly_sales": weekly_sales,
             "units_by_product": units_by_product,
-            "avg_sale_by_region": avg_sale_by_region,
-            "raw_data": self.df
+            "avg_sale_by_region": avg_sale_by_region
         }
 
 
 class ReportGenerator:
     """Class to generate summary reports from analysis results"""
     
+    def __init__(self):
+        # Format objects created so far, keyed by their properties. They belong
+        # to a single workbook, so the cache is reset when the workbook changes.
+        self._format_workbook = None
+        self._format_cache = {}
+    
     def create_report(self, analysis_results, filename="sales_summary.xlsx", output_dir="output"):
         """
         Create a summary report in Excel with charts and tables
@@ -276,19 +378,19 @@ class ReportGenerator:
                 workbook = writer.book
                 
                 # Create Summary Sheet
-                self._create_summary_sheet(workbook, writer, analysis_results)
+                self._create_summary_sheet(workbook, analysis_results)
                 
                 # Create Product Sales Sheet
-                self._create_product_sheet(workbook, writer, analysis_results)
+                self._create_product_sheet(workbook, analysis_results)
                 
                 # Create Regional Sales Sheet
-                self._create_region_sheet(workbook, writer, analysis_results)
+                self._create_region_sheet(workbook, analysis_results)
                 
                 # Create Weekly Sales Trend Sheet
-                self._create_trend_sheet(workbook, writer, analysis_results)
+                self._create_trend_sheet(workbook, analysis_results)
                 
                 # Create Channel Sheet
-                self._create_channel_sheet(workbook, writer, analysis_results)
+                self._create_channel_sheet(workbook, analysis_results)
             
             logger.info(f"Summary report successfully created at {filepath}")
             return filepath
@@ -297,80 +399,86 @@ class ReportGenerator:
             logger.error(f"Error creating summary report: {str(e)}")
             raise
     
-    def _create_summary_sheet(self, workbook, writer, analysis_results):
+    def _get_format(self, workbook, props):
+        """Return a Format for props, reusing the one already created for this workbook"""
+        if workbook is not self._format_workbook:
+            self._format_workbook = workbook
+            self._format_cache = {}
+        
+        key = tuple(sorted(props.items()))
+        if key not in self._format_cache:
+            self._format_cache[key] = workbook.add_format(dict(props))
+        return self._format_cache[key]
+    
+    def _create_summary_sheet(self, workbook, analysis_results):
         """Create the summary overview sheet"""
-        summary_data = pd.DataFrame({
-            'Metric': [
-                'Total Sales', 
-                'Average Sale per Transaction', 
-                'Maximum Sale',
-                'Top Product',
-                'Top Region',
-                'Top Channel'
-            ],
-            'Value': [
-                f"${analysis_results['total_sales']:,.2f}",
-                f"${analysis_results['avg_sale']:,.2f}",
-                f"${analysis_results['max_sale']:,.2f}",
-                f"{analysis_results['product_sales'].index[0]}",
-                f"{analysis_results['region_sales'].index[0]}",
-                f"{analysis_results['channel_sales'].index[0]}"
-            ]
-        })
-        
-        summary_data.to_excel(writer, sheet_name='Summary', index=False)
-        summary_sheet = writer.sheets['Summary']
+        metrics = [
+            'Total Sales', 
+            'Average Sale per Transaction', 
+            'Maximum Sale',
+            'Top Product',
+            'Top Region',
+            'Top Channel'
+        ]
+        values = [
+            f"${analysis_results['total_sales']:,.2f}",
+            f"${analysis_results['avg_sale']:,.2f}",
+            f"${analysis_results['max_sale']:,.2f}",
+            f"{analysis_results['product_sales'].index[0]}",
+            f"{analysis_results['region_sales'].index[0]}",
+            f"{analysis_results['channel_sales'].index[0]}"
+        ]
+        
+        summary_sheet = workbook.add_worksheet('Summary')
         
         # Format summary sheet
-        header_format = workbook.add_format({
+        header_format = self._get_format(workbook, {
             'bold': True, 
             'bg_color': '#B8CCE4',
             'border': 1,
             'align': 'center'
         })
         
-        cell_format = workbook.add_format({
+        cell_format = self._get_format(workbook, {
             'border': 1,
             'align': 'left'
         })
         
-        for col_num, value in enumerate(summary_data.columns.values):
-            summary_sheet.write(0, col_num, value, header_format)
+        # Cell format comes from the column defaults; only the header is styled per cell
+        summary_sheet.set_column('A:A', 30, cell_format)
+        summary_sheet.set_column('B:B', 20, cell_format)
         
-        # Apply cell format to all cells
-        for row_num in range(1, len(summary_data) + 1):
-            for col_num in range(len(summary_data.columns)):
-                summary_sheet.write(row_num, col_num, summary_data.iloc[row_num-1, col_num], cell_format)
-        
-        summary_sheet.set_column('A:A', 30)
-        summary_sheet.set_column('B:B', 20)
+        summary_sheet.write_row(0, 0, ['Metric', 'Value'], header_format)
+        summary_sheet.write_column(1, 0, metrics)
+        summary_sheet.write_column(1, 1, values)
     
-    def _create_product_sheet(self, workbook, writer, analysis_results):
+    def _create_product_sheet(self, workbook, analysis_results):
         """Create the product sales sheet with chart"""
-        product_data = analysis_results['product_sales'].reset_index()
-        product_data.columns = ['Product', 'Total Sales']
-        product_data['Total Sales'] = product_data['Total Sales'].round(2)
+        product_sales = analysis_results['product_sales']
+        product_totals = np.round(product_sales.values, 2)
         
-        product_data.to_excel(writer, sheet_name='Product_Sales', index=False)
-        product_sheet = writer.sheets['Product_Sales']
+        product_sheet = workbook.add_worksheet('Product_Sales')
         
         # Format columns
-        header_format = workbook.add_format({
+        header_format = self._get_format(workbook, {
             'bold': True, 
             'bg_color': '#E6B8B7',
             'border': 1,
             'align': 'center'
         })
         
-        for col_num, value in enumerate(product_data.columns.values):
-            product_sheet.write(0, col_num, value, header_format)
+        money_format = self._get_format(workbook, {'num_format': '$#,##0.00'})
+        
+        product_sheet.write_row(0, 0, ['Product', 'Total Sales'], header_format)
+        product_sheet.write_column(1, 0, product_sales.index.tolist())
+        product_sheet.write_column(1, 1, product_totals.tolist(), money_format)
         
         # Add chart
         chart = workbook.add_chart({'type': 'column'})
         chart.add_series({
             'name': 'Sales by Product',
-            'categories': ['Product_Sales', 1, 0, len(product_data), 0],
-            'values': ['Product_Sales', 1, 1, len(product_data), 1],
+            'categories': ['Product_Sales', 1, 0, len(product_sales), 0],
+            'values': ['Product_Sales', 1, 1, len(product_sales), 1],
             'data_labels': {'value': True}
         })
         
@@ -381,37 +489,37 @@ class ReportGenerator:
         chart.set_size({'width': 720, 'height': 400})
         product_sheet.insert_chart('D2', chart)
     
-    def _create_region_sheet(self, workbook, writer, analysis_results):
+    def _create_region_sheet(self, workbook, analysis_results):
         """Create the regional sales sheet with chart"""
-        region_data = analysis_results['region_sales'].reset_index()
-        region_data.columns = ['Region', 'Total Sales']
-        region_data['Total Sales'] = region_data['Total Sales'].round(2)
+        region_sales = analysis_results['region_sales']
+        region_totals = np.round(region_sales.values, 2)
         
         # Add percentage column
-        total = region_data['Total Sales'].sum()
-        region_data['Percentage'] = (region_data['Total Sales'] / total * 100).round(2)
-        region_data['Percentage'] = region_data['Percentage'].apply(lambda x: f"{x}%")
+        region_share = np.round(region_totals / region_totals.sum() * 100, 2)
         
-        region_data.to_excel(writer, sheet_name='Regional_Sales', index=False)
-        region_sheet = writer.sheets['Regional_Sales']
+        region_sheet = workbook.add_worksheet('Regional_Sales')
         
         # Format header
-        header_format = workbook.add_format({
+        header_format = self._get_format(workbook, {
             'bold': True, 
             'bg_color': '#B7DEE8',
             'border': 1,
             'align': 'center'
         })
         
-        for col_num, value in enumerate(region_data.columns.values):
-            region_sheet.write(0, col_num, value, header_format)
+        money_format = self._get_format(workbook, {'num_format': '$#,##0.00'})
+        
+        region_sheet.write_row(0, 0, ['Region', 'Total Sales', 'Percentage'], header_format)
+        region_sheet.write_column(1, 0, region_sales.index.tolist())
+        region_sheet.write_column(1, 1, region_totals.tolist(), money_format)
+        region_sheet.write_column(1, 2, [f"{x}%" for x in region_share.tolist()])
         
         # Add pie chart
         chart = workbook.add_chart({'type': 'pie'})
         chart.add_series({
             'name': 'Sales by Region',
-            'categories': ['Regional_Sales', 1, 0, len(region_data), 0],
-            'values': ['Regional_Sales', 1, 1, len(region_data), 1],
+            'categories': ['Regional_Sales', 1, 0, len(region_sales), 0],
+            'values': ['Regional_Sales', 1, 1, len(region_sales), 1],
             'data_labels': {'percentage': True}
         })
         
@@ -420,32 +528,33 @@ class ReportGenerator:
         chart.set_size({'width': 600, 'height': 400})
         region_sheet.insert_chart('E2', chart)
     
-    def _create_trend_sheet(self, workbook, writer, analysis_results):
+    def _create_trend_sheet(self, workbook, analysis_results):
         """Create the weekly trend sheet with chart"""
-        weekly_data = analysis_results['weekly_sales'].reset_index()
-        weekly_data.columns = ['Week', 'Total Sales']
-        weekly_data['Total Sales'] = weekly_data['Total Sales'].round(2)
+        weekly_sales = analysis_results['weekly_sales']
+        trend_totals = np.round(weekly_sales.values, 2)
         
-        weekly_data.to_excel(writer, sheet_name='Weekly_Trend', index=False)
-        trend_sheet = writer.sheets['Weekly_Trend']
+        trend_sheet = workbook.add_worksheet('Weekly_Trend')
         
         # Format header
-        header_format = workbook.add_format({
+        header_format = self._get_format(workbook, {
             'bold': True, 
             'bg_color': '#CCC0DA',
             'border': 1,
             'align': 'center'
         })
         
-        for col_num, value in enumerate(weekly_data.columns.values):
-            trend_sheet.write(0, col_num, value, header_format)
+        money_format = self._get_format(workbook, {'num_format': '$#,##0.00'})
+        
+        trend_sheet.write_row(0, 0, ['Week', 'Total Sales'], header_format)
+        trend_sheet.write_column(1, 0, weekly_sales.index.tolist())
+        trend_sheet.write_column(1, 1, trend_totals.tolist(), money_format)
         
         # Add line chart
         chart = workbook.add_chart({'type': 'line'})
         chart.add_series({
             'name': 'Weekly Sales Trend',
-            'categories': ['Weekly_Trend', 1, 0, len(weekly_data), 0],
-            'values': ['Weekly_Trend', 1, 1, len(weekly_data), 1],
+            'categories': ['Weekly_Trend', 1, 0, len(weekly_sales), 0],
+            'values': ['Weekly_Trend', 1, 1, len(weekly_sales), 1],
             'marker': {'type': 'circle'},
             'line': {'width': 2.5}
         })
@@ -457,32 +566,33 @@ class ReportGenerator:
         chart.set_size({'width': 720, 'height': 400})
         trend_sheet.insert_chart('D2', chart)
     
-    def _create_channel_sheet(self, workbook, writer, analysis_results):
+    def _create_channel_sheet(self, workbook, analysis_results):
         """Create the sales channel sheet with chart"""
-        channel_data = analysis_results['channel_sales'].reset_index()
-        channel_data.columns = ['Channel', 'Total Sales']
-        channel_data['Total Sales'] = channel_data['Total Sales'].round(2)
+        channel_sales = analysis_results['channel_sales']
+        channel_totals = np.round(channel_sales.values, 2)
         
-        channel_data.to_excel(writer, sheet_name='Channel_Sales', index=False)
-        channel_sheet = writer.sheets['Channel_Sales']
+        channel_sheet = workbook.add_worksheet('Channel_Sales')
         
         # Format header
-        header_format = workbook.add_format({
+        header_format = self._get_format(workbook, {
             'bold': True, 
             'bg_color': '#D8E4BC',
             'border': 1,
             'align': 'center'
         })
         
-        for col_num, value in enumerate(channel_data.columns.values):
-            channel_sheet.write(0, col_num, value, header_format)
+        money_format = self._get_format(workbook, {'num_format': '$#,##0.00'})
+        
+        channel_sheet.write_row(0, 0, ['Channel', 'Total Sales'], header_format)
+        channel_sheet.write_column(1, 0, channel_sales.index.tolist())
+        channel_sheet.write_column(1, 1, channel_totals.tolist(), money_format)
         
         # Add bar chart
         chart = workbook.add_chart({'type': 'bar'})
         chart.add_series({
             'name': 'Sales by Channel',
-            'categories': ['Channel_Sales', 1, 0, len(channel_data), 0],
-            'values': ['Channel_Sales', 1, 1, len(channel_data), 1],
+            'categories': ['Channel_Sales', 1, 0, len(channel_sales), 0],
+            'values': ['Channel_Sales', 1, 1, len(channel_sales), 1],
             'data_labels': {'value': True}
         })
         
@@ -502,6 +612,8 @@ def parse_args():
     parser.add_argument('--output-dir', type=str, default='output', help='Directory to save output files')
     parser.add_argument('--data-file', type=str, default='sales_data.xlsx', help='Filename for raw data')
     parser.add_argument('--report-file', type=str, default='sales_summary.xlsx', help='Filename for summary report')
+    parser.add_argument('--engine', choices=ExcelWriter.ENGINES, default='xlsxwriter',
+                        help='Engine for writing the raw data file (pyexcelerate skips formatting)')
     parser.add_argument('--verbose', action='store_true', help='Enable verbose logging')
     
     return parser.parse_args()
@@ -523,7 +635,7 @@ def main():
         sales_df = data_generator.generate_data(num_records=args.records, days_back=args.days)
         
         # Step 2: Write to Excel
-        excel_writer = ExcelWriter()
+        excel_writer = ExcelWriter(engine=args.engine)
         sales_file = excel_writer.write_sales_data(
             sales_df, 
             filename=args.data_file, 
@@ -10,12 +10,15 @@ file_path = os.getenv('INPUT_FILE_PATH')
 output_file = os.getenv('OUTPUT_FILE_PATH')
 sheet_name = os.getenv('SHEET_NAME')
 column_name = os.getenv('COLUMN_NAME')
+name_column_only = os.getenv('NAME_COLUMN_ONLY', 'false').lower() in ('1', 'true', 'yes')
 
-# Read the Excel file
-df = pd.read_excel(file_path, sheet_name=sheet_name)
+# Read the Excel file (only the name column when NAME_COLUMN_ONLY is set)
+usecols = [column_name] if name_column_only else None
+df = pd.read_excel(file_path, sheet_name=sheet_name, usecols=usecols, engine='openpyxl')
 
 # Extract the last word from the full name as the last name
-df['Last Name'] = df[column_name].apply(lambda x: str(x).split()[-1] if pd.notnull(x) else '')
+names = df[column_name].fillna('').astype(str)
+df['Last Name'] = names.str.rsplit(n=1).str[-1].fillna('')
 
 # Save the modified DataFrame to a new Excel file
 df.to_excel(output_file, index=False)